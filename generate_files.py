@@ -8,14 +8,17 @@ import os
 import random
 import string
 import json
-import xml.etree.ElementTree as ET
+import base64
 import sqlite3
 import wave
-import struct
 import zipfile
-import csv
 import io
+import errno
+import mmap
+import functools
+import itertools
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
@@ -26,80 +29,336 @@ from reportlab.lib.pagesizes import letter, A4
 from reportlab.pdfgen import canvas
 from reportlab.lib.colors import HexColor
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Fill, PatternFill
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from docx import Document
 from docx.shared import Inches as DocxInches, Pt as DocxPt
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Optional: C JSON encoder, falls back to the standard library when missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: C XML tree and serializer, same TreeBuilder API as the standard library
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 
 
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
-def random_string(min_len=5, max_len=20):
-    """Generate a random string of letters."""
-    length = random.randint(min_len, max_len)
-    return ''.join(random.choices(string.ascii_letters, k=length))
+# Buffer size for generated file writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+# In-memory payloads at least this large are written with O_DIRECT where the
+# filesystem allows it, so they don't churn the page cache
+DIRECT_WRITE_MIN_SIZE = 4 << 20
+_DIRECT_WRITE_ALIGN = 4096
+
+# Byte lookup tables for vectorized string generation
+_ALPHABET = np.frombuffer(string.ascii_letters.encode(), np.uint8)
+_LOWERCASE = np.frombuffer(string.ascii_lowercase.encode(), np.uint8)
+
+_rng = np.random.default_rng()
+
+
+def _split_runs(seq, lens):
+    """Split seq into consecutive slices of the given lengths."""
+    ends = np.cumsum(lens).tolist()
+    return [seq[start:end] for start, end in zip([0] + ends[:-1], ends)]
+
+
+def random_strings_batch(n, min_len=5, max_len=20, alphabet=_ALPHABET, rng=None):
+    """Generate a list of n random strings in a single vectorized pass."""
+    rng = rng or _rng
+    lens = rng.integers(min_len, max_len + 1, size=n)
+    idx = rng.integers(0, len(alphabet), size=int(lens.sum()), dtype=np.int8)
+    return _split_runs(alphabet[idx].tobytes().decode('ascii'), lens)
+
+
+# Sentences and paragraphs are generated in batches and handed out one at
+# a time, like the color pool. Each entry is used once, so pooling does not
+# repeat text. Pools are keyed by their length range.
+_SENTENCE_POOL_SIZE = 256
+_PARAGRAPH_POOL_SIZE = 32
+_sentence_pools = {}
+_paragraph_pools = {}
+
+
+# Fixed vocabulary that sentences and paragraphs sample from, like a
+# lorem ipsum corpus. Built from its own seed so SEED runs stay reproducible.
+_VOCAB = np.array(random_strings_batch(10_000, 3, 12, _LOWERCASE, np.random.default_rng(0)), dtype=object)
+
+
+# Vocabulary with the first letter upper-cased, used for sentence openers
+_VOCAB_CAPITALIZED = np.array([word.capitalize() for word in _VOCAB], dtype=object)
 
 
 def random_word():
     """Generate a random word-like string."""
-    return random_string(3, 12).lower()
+    return _VOCAB[_rng.integers(0, len(_VOCAB))]
+
+
+def random_words(n):
+    """Generate a list of n random word-like strings."""
+    return _VOCAB[_rng.integers(0, len(_VOCAB), size=n)].tolist()
+
+
+# Sentence endings
+_TERMINATORS = np.array(['.', '!', '?'], dtype=object)
+
+
+def _sentences_batch(n, min_words, max_words):
+    """Generate a list of n random sentences from a single word draw."""
+    lens = _rng.integers(min_words, max_words + 1, size=n)
+    ends = np.cumsum(lens)
+    starts = ends - lens
+    
+    # Capitalize and punctuate whole batches of words with array indexing,
+    # leaving only the final join to Python
+    idx = _rng.integers(0, len(_VOCAB), size=int(ends[-1]))
+    words = _VOCAB[idx]
+    words[starts] = _VOCAB_CAPITALIZED[idx[starts]]
+    words[ends - 1] += _TERMINATORS[_rng.integers(0, len(_TERMINATORS), size=n)]
+    return [' '.join(run) for run in _split_runs(words.tolist(), lens)]
 
 
 def random_sentence(min_words=5, max_words=20):
     """Generate a random sentence."""
-    num_words = random.randint(min_words, max_words)
-    words = [random_word() for _ in range(num_words)]
-    words[0] = words[0].capitalize()
-    return ' '.join(words) + random.choice(['.', '!', '?'])
+    pool = _sentence_pools.get((min_words, max_words))
+    if not pool:
+        pool = _sentence_pools[min_words, max_words] = _sentences_batch(_SENTENCE_POOL_SIZE, min_words, max_words)
+    return pool.pop()
 
 
 def random_paragraph(min_sentences=3, max_sentences=10):
     """Generate a random paragraph."""
-    num_sentences = random.randint(min_sentences, max_sentences)
-    return ' '.join(random_sentence() for _ in range(num_sentences))
+    pool = _paragraph_pools.get((min_sentences, max_sentences))
+    if not pool:
+        counts = _rng.integers(min_sentences, max_sentences + 1, size=_PARAGRAPH_POOL_SIZE)
+        sentences = _sentences_batch(int(counts.sum()), 5, 20)
+        pool = _paragraph_pools[min_sentences, max_sentences] = [' '.join(run) for run in _split_runs(sentences, counts)]
+    return pool.pop()
+
+
+# Reference time for log timestamps and filename dates. Normally the moment
+# the run started; seeded runs pin it to a fixed epoch (see seed_generators)
+# so their output doesn't depend on when they are run.
+_RUN_START = datetime.now()
+_FIXED_EPOCH = datetime(2025, 1, 1)
+_clock = _RUN_START
+_fixed_clock = False
+
+# Date stamp used in filenames, fixed for the duration of a run
+_TODAY = _clock.strftime('%Y%m%d')
+
+# Filename patterns used by random_filename()
+_FILENAME_STYLES = (
+    lambda _randint=random.randint, _grb=random.getrandbits, _b32=base64.b32encode:
+        _b32(_grb(64).to_bytes(8, 'little')).decode('ascii').lower()[:_randint(6, 12)],
+    lambda: f"{random_word()}_{random_word()}",
+    lambda _randint=random.randint: f"{random_word()}-{_randint(1, 9999)}",
+    lambda _randint=random.randint: f"{random_word()}_{_TODAY}_{_randint(1, 999)}",
+    lambda _grb=random.getrandbits: f"{_grb(32):08x}",
+)
+
+
+def random_filename(_choice=random.choice, _styles=_FILENAME_STYLES):
+    """Generate a random filename (without extension)."""
+    return _choice(_styles)()
 
 
-def random_filename():
-    """Generate a random filename (without extension)."""
-    styles = [
-        lambda: ''.join(random.choices(string.ascii_lowercase + string.digits, k=random.randint(6, 12))),
-        lambda: f"{random_word()}_{random_word()}",
-        lambda: f"{random_word()}-{random.randint(1, 9999)}",
-        lambda: f"{random_word()}_{datetime.now().strftime('%Y%m%d')}_{random.randint(1, 999)}",
-        lambda: ''.join(random.choices(string.hexdigits.lower(), k=8)),
-    ]
-    return random.choice(styles)()
+_BASE32_LOWER = np.frombuffer(b'abcdefghijklmnopqrstuvwxyz234567', np.uint8)
+
+
+def random_filenames_batch(n):
+    """Generate n random filenames (without extensions), each style built in bulk."""
+    counts = _rng.multinomial(n, [1 / len(_FILENAME_STYLES)] * len(_FILENAME_STYLES)).tolist()
+    words = iter(random_words(2 * counts[1] + counts[2] + counts[3]))
+    
+    names = random_strings_batch(counts[0], 6, 12, _BASE32_LOWER)
+    names += [f"{next(words)}_{next(words)}" for _ in range(counts[1])]
+    names += [f"{next(words)}-{num}" for num in _rng.integers(1, 10000, size=counts[2]).tolist()]
+    names += [f"{next(words)}_{_TODAY}_{num}" for num in _rng.integers(1, 1000, size=counts[3]).tolist()]
+    names += [f"{num:08x}" for num in _rng.integers(0, 1 << 32, size=counts[4]).tolist()]
+    
+    random.shuffle(names)
+    return names
+
+
+# RGB tuples drawn from NumPy in batches and handed out one at a time
+_COLOR_POOL_SIZE = 4096
+_color_pool = []
 
 
 def random_color():
     """Generate a random RGB color tuple."""
-    return (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
+    if not _color_pool:
+        values = _rng.integers(0, 1 << 24, size=_COLOR_POOL_SIZE)
+        _color_pool.extend(zip((values >> 16).tolist(), ((values >> 8) & 0xFF).tolist(), (values & 0xFF).tolist()))
+    return _color_pool.pop()
 
 
-def random_hex_color():
+def random_hex_color(_grb=random.getrandbits):
     """Generate a random hex color string."""
-    return "#{:06x}".format(random.randint(0, 0xFFFFFF))
+    return f"#{_grb(24):06x}"
 
 
-def random_date(start_year=2020, end_year=2026):
-    """Generate a random date."""
+@functools.lru_cache(maxsize=32)
+def _date_range(start_year, end_year):
+    """Return the start datetime and span in days for a range of years."""
     start = datetime(start_year, 1, 1)
-    end = datetime(end_year, 12, 31)
-    delta = end - start
-    random_days = random.randint(0, delta.days)
-    return start + timedelta(days=random_days)
+    return start, (datetime(end_year, 12, 31) - start).days
+
+
+@functools.lru_cache(maxsize=None)
+def _default_font():
+    """Load PIL's default font once and share it across images."""
+    return ImageFont.load_default()
+
+
+def json_dumps(obj):
+    """Serialize an object to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _open_write(filepath, binary=False):
+    """Open a file for writing with a 1 MiB buffer."""
+    if binary:
+        return open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE)
+    return open(filepath, 'w', buffering=WRITE_BUFFER_SIZE, encoding='utf-8')
 
 
-def ensure_size_limit(content, max_bytes):
-    """Ensure content doesn't exceed max bytes."""
-    if isinstance(content, str):
-        content = content.encode('utf-8')
-    return content[:max_bytes]
+def _preallocate(f, size):
+    """Reserve the final size of a large file up front where supported."""
+    if size >= WRITE_BUFFER_SIZE and hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+        except OSError:
+            pass  # Filesystem doesn't support preallocation
+
+
+def _open_preallocated(filepath, size):
+    """Open a binary file for writing with its final size reserved up front."""
+    f = _open_write(filepath, binary=True)
+    _preallocate(f, size)
+    return f
+
+
+def _write_direct(filepath, data):
+    """Write data with O_DIRECT, returning False if the filesystem refuses it."""
+    size = len(data)
+    aligned_size = -(-size // _DIRECT_WRITE_ALIGN) * _DIRECT_WRITE_ALIGN
+    try:
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o644)
+    except OSError as e:
+        if e.errno == errno.EINVAL:
+            return False
+        raise
+    try:
+        # Anonymous maps are page aligned, as O_DIRECT requires; the padding
+        # past the payload is cut off again by the truncate
+        with mmap.mmap(-1, aligned_size) as buf:
+            buf.write(data)
+            with memoryview(buf) as view:
+                written = 0
+                while written < aligned_size:
+                    written += os.write(fd, view[written:])
+        os.ftruncate(fd, size)
+    except OSError as e:
+        if e.errno == errno.EINVAL:
+            return False
+        raise
+    finally:
+        os.close(fd)
+    return True
+
+
+def _write_all(f, data):
+    """Write all of data to an unbuffered file, looping on partial writes."""
+    view = memoryview(data)
+    while view:
+        view = view[f.write(view):]
+
+
+def write_bytes(filepath, data):
+    """Write a complete in-memory file straight to its descriptor and return its size."""
+    size = len(data)
+    if size >= DIRECT_WRITE_MIN_SIZE and hasattr(os, 'O_DIRECT') and _write_direct(filepath, data):
+        return size
+    
+    # The payload is already whole, so skip the userspace buffer copy and
+    # hand it to the kernel directly, usually in a single write call
+    with open(filepath, 'wb', buffering=0) as f:
+        _preallocate(f, size)
+        _write_all(f, data)
+    return size
+
+
+# Fixed-size write blocks kept for reuse by later write_text_stream calls, so
+# a worker producing many files doesn't allocate and free them per file
+_block_pool = []
+
+
+def write_text_stream(filepath, max_bytes, chunks):
+    """Stream encoded text chunks to a file, overlapping disk writes with generation."""
+    # Two blocks take turns: one is filled while the writer thread flushes
+    # the other. They keep their size, so filling is slice assignment only.
+    blocks = [_block_pool.pop() if _block_pool else bytearray(WRITE_BUFFER_SIZE) for _ in range(2)]
+    block = blocks[0]
+    fill = 0
+    written = 0
+    
+    try:
+        # Unbuffered, so the writer thread issues the disk write for the block
+        # it is handed instead of copying it into a file buffer
+        with open(filepath, 'wb', buffering=0) as f, ThreadPoolExecutor(max_workers=1) as writer:
+            pending = None
+            for chunk in chunks:
+                data = memoryview(chunk.encode('utf-8'))
+                remaining = max_bytes - written - fill
+                last = len(data) >= remaining
+                if last:
+                    data = data[:remaining]
+                
+                while data:
+                    n = min(len(data), WRITE_BUFFER_SIZE - fill)
+                    block[fill:fill + n] = data[:n]
+                    fill += n
+                    data = data[n:]
+                    if fill == WRITE_BUFFER_SIZE:
+                        # Hand the full block to the writer thread and keep
+                        # generating into the other one once it is free
+                        if pending:
+                            pending.result()
+                        pending = writer.submit(_write_all, f, block)
+                        written += fill
+                        block = blocks[block is blocks[0]]
+                        fill = 0
+                
+                if last:
+                    break
+            
+            if pending:
+                pending.result()
+            _write_all(f, memoryview(block)[:fill])
+    finally:
+        _block_pool.extend(blocks)
+    
+    return written + fill
 
 
 # =============================================================================
@@ -109,122 +368,165 @@ def ensure_size_limit(content, max_bytes):
 def generate_txt(filepath, max_size_mb=1):
     """Generate a random text file."""
     max_bytes = int(max_size_mb * 1024 * 1024)
-    content = []
-    current_size = 0
-    
-    while current_size < max_bytes:
-        paragraph = random_paragraph() + "\n\n"
-        content.append(paragraph)
-        current_size += len(paragraph.encode('utf-8'))
-        if current_size > max_bytes:
-            break
-    
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(''.join(content)[:max_bytes])
+    paragraphs = (random_paragraph() + "\n\n" for _ in itertools.count())
+    return write_text_stream(filepath, max_bytes, paragraphs)
+
+
+# Approximate rendered width of a CSV cell of each kind, including its separator
+_CSV_CELL_BYTES = {'string': 8.5, 'int': 5.9, 'float': 8.5, 'date': 11}
+
+_CSV_KINDS = ('string', 'int', 'float', 'date')
+
+
+def generate_column(kind, n):
+    """Generate a column of n random values of the given kind."""
+    if kind == 'string':
+        return random_words(n)
+    elif kind == 'int':
+        return _rng.integers(-10000, 10001, size=n)
+    elif kind == 'float':
+        return _rng.uniform(-1000, 1000, size=n).round(2)
+    else:  # date
+        start, days = _date_range(2020, 2026)
+        offsets = _rng.integers(0, days + 1, size=n).astype('timedelta64[D]')
+        return np.datetime64(start.date()) + offsets
 
 
 def generate_csv(filepath, max_size_mb=1):
     """Generate a random CSV file."""
     max_bytes = int(max_size_mb * 1024 * 1024)
     
-    # Random column names
+    # Random column names and types
     num_cols = random.randint(3, 10)
     headers = [random_word() for _ in range(num_cols)]
+    kinds = [random.choice(_CSV_KINDS) for _ in range(num_cols)]
     
-    rows = []
-    current_size = 0
+    # Size the table from the expected row width, then trim to the limit
+    row_bytes = sum(_CSV_CELL_BYTES[kind] for kind in kinds)
+    num_rows = max(1, int(max_bytes * 1.05 / row_bytes))
     
-    while current_size < max_bytes:
-        row = []
-        for _ in range(num_cols):
-            cell_type = random.choice(['string', 'int', 'float', 'date'])
-            if cell_type == 'string':
-                row.append(random_word())
-            elif cell_type == 'int':
-                row.append(str(random.randint(-10000, 10000)))
-            elif cell_type == 'float':
-                row.append(f"{random.uniform(-1000, 1000):.2f}")
-            else:
-                row.append(random_date().strftime('%Y-%m-%d'))
-        
-        row_str = ','.join(row) + '\n'
-        current_size += len(row_str.encode('utf-8'))
-        rows.append(row)
-        
-        if current_size > max_bytes:
-            break
+    df = pd.DataFrame({i: generate_column(kind, num_rows) for i, kind in enumerate(kinds)})
+    df.columns = headers
+    content = df.to_csv(index=False, float_format='%.2f', lineterminator='\n').encode('utf-8')
+    if len(content) > max_bytes:
+        content = content[:content.rfind(b'\n', 0, max_bytes) + 1]
     
-    with open(filepath, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow(headers)
-        writer.writerows(rows)
+    return write_bytes(filepath, content)
+
+
+_JSON_TYPES = ('string', 'int', 'float', 'bool', 'list', 'dict', 'null')
 
 
 def generate_json(filepath, max_size_mb=1):
     """Generate a random JSON file."""
     max_bytes = int(max_size_mb * 1024 * 1024)
     
-    def random_value(depth=0):
-        if depth > 3:
-            return random_word()
-        
-        value_type = random.choice(['string', 'int', 'float', 'bool', 'list', 'dict', 'null'])
-        if value_type == 'string':
-            return random_sentence()
-        elif value_type == 'int':
-            return random.randint(-10000, 10000)
-        elif value_type == 'float':
-            return round(random.uniform(-1000, 1000), 2)
-        elif value_type == 'bool':
-            return random.choice([True, False])
-        elif value_type == 'null':
-            return None
-        elif value_type == 'list':
-            return [random_value(depth + 1) for _ in range(random.randint(1, 5))]
-        else:  # dict
-            return {random_word(): random_value(depth + 1) for _ in range(random.randint(1, 5))}
-    
-    data = {random_word(): random_value() for _ in range(random.randint(5, 20))}
-    
-    content = json.dumps(data, indent=2)
-    if len(content.encode('utf-8')) > max_bytes:
-        content = content[:max_bytes]
+    def random_value(_choice=random.choice, _randint=random.randint):
+        # Fill containers from an explicit stack of (parent, key, depth) slots
+        # instead of recursing once per nested value.
+        root = [None]
+        stack = [(root, 0, 0)]
+        while stack:
+            parent, key, depth = stack.pop()
+            if depth > 3:
+                parent[key] = random_word()
+                continue
+            
+            value_type = _choice(_JSON_TYPES)
+            if value_type == 'string':
+                value = random_sentence()
+            elif value_type == 'int':
+                value = _randint(-10000, 10000)
+            elif value_type == 'float':
+                value = round(random.uniform(-1000, 1000), 2)
+            elif value_type == 'bool':
+                value = random.getrandbits(1) == 1
+            elif value_type == 'null':
+                value = None
+            elif value_type == 'list':
+                value = [None] * _randint(1, 5)
+                stack.extend((value, i, depth + 1) for i in range(len(value)))
+            else:  # dict
+                value = dict.fromkeys(random_word() for _ in range(_randint(1, 5)))
+                stack.extend((value, child, depth + 1) for child in value)
+            parent[key] = value
+        return root[0]
+    
+    # Serialize one top-level item at a time and keep a running byte count,
+    # so the object is closed before the limit instead of being sliced.
+    items = []
+    size = 2  # braces
+    for key in dict.fromkeys(random_word() for _ in range(random.randint(5, 20))):
+        item = json_dumps(key) + b':' + json_dumps(random_value())
+        size += len(item) + 1
+        if size > max_bytes:
+            break
+        items.append(item)
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    return write_bytes(filepath, b'{' + b','.join(items) + b'}')
 
 
 def generate_xml(filepath, max_size_mb=1):
     """Generate a random XML file."""
     max_bytes = int(max_size_mb * 1024 * 1024)
     
-    root = ET.Element(random_word())
+    builder = ET.TreeBuilder()
+    current_size = 0
     
-    def add_children(parent, depth=0, current_size=[0]):
-        if depth > 4 or current_size[0] > max_bytes:
-            return
+    root_tag = random_word()
+    builder.start(root_tag, {})
+    
+    # Depth-first walk over an explicit stack. (None, depth) opens a new
+    # element at that depth; (tag, depth) closes an element already opened.
+    stack = [(None, 0) for _ in range(random.randint(1, 5))]
+    while stack:
+        tag, depth = stack.pop()
+        if tag is not None:
+            builder.end(tag)
+            continue
+        if current_size > max_bytes:
+            continue
         
-        num_children = random.randint(1, 5)
-        for _ in range(num_children):
-            if current_size[0] > max_bytes:
-                break
-            child = ET.SubElement(parent, random_word())
-            
-            # Add attributes
-            if random.random() > 0.5:
-                child.set(random_word(), random_word())
-            
-            # Add text or more children
-            if random.random() > 0.3 and depth < 4:
-                add_children(child, depth + 1, current_size)
-            else:
-                child.text = random_sentence()
-                current_size[0] += len(child.text.encode('utf-8'))
+        tag = random_word()
+        
+        # Add attributes
+        attrs = {random_word(): random_word()} if random.random() > 0.5 else {}
+        builder.start(tag, attrs)
+        stack.append((tag, depth))
+        
+        # Add text or more children
+        if random.random() > 0.3 and depth < 4:
+            stack.extend((None, depth + 1) for _ in range(random.randint(1, 5)))
+        else:
+            text = random_sentence()
+            builder.data(text)
+            current_size += len(text)  # generated text is ASCII, one byte per char
     
-    add_children(root)
+    builder.end(root_tag)
     
-    tree = ET.ElementTree(root)
-    tree.write(filepath, encoding='utf-8', xml_declaration=True)
+    content = ET.tostring(builder.close(), encoding='utf-8', xml_declaration=True)
+    return write_bytes(filepath, content)
+
+
+_HTML_ELEMENTS = ('h1', 'h2', 'h3', 'p', 'div', 'ul', 'table')
+_HTML_HEADINGS = ('h1', 'h2', 'h3')
+_HTML_FONTS = ('Arial', 'Helvetica', 'Georgia', 'Times New Roman')
+
+# Document head for generate_html, filled with %-formatting
+_HTML_HEAD = (
+    '<!DOCTYPE html>\n'
+    '<html lang="en">\n'
+    '<head>\n'
+    '    <meta charset="UTF-8">\n'
+    '    <title>%s</title>\n'
+    '    <style>\n'
+    '        body { font-family: %s; background-color: %s; }\n'
+    '        h1 { color: %s; }\n'
+    '        p { color: %s; }\n'
+    '    </style>\n'
+    '</head>\n'
+    '<body>\n'
+)
 
 
 def generate_html(filepath, max_size_mb=1):
@@ -232,28 +534,19 @@ def generate_html(filepath, max_size_mb=1):
     max_bytes = int(max_size_mb * 1024 * 1024)
     
     title = random_sentence(2, 5)
+    head = _HTML_HEAD % (title, random.choice(_HTML_FONTS), random_hex_color(), random_hex_color(), random_hex_color())
+    
+    # Lines are encoded straight into one growing buffer
+    buf = bytearray(head.encode('utf-8'))
+    
+    def emit(line):
+        buf.extend(line.encode('utf-8'))
+        buf.extend(b'\n')
     
-    html_parts = [
-        '<!DOCTYPE html>',
-        '<html lang="en">',
-        '<head>',
-        f'    <meta charset="UTF-8">',
-        f'    <title>{title}</title>',
-        f'    <style>',
-        f'        body {{ font-family: {random.choice(["Arial", "Helvetica", "Georgia", "Times New Roman"])}; background-color: {random_hex_color()}; }}',
-        f'        h1 {{ color: {random_hex_color()}; }}',
-        f'        p {{ color: {random_hex_color()}; }}',
-        f'    </style>',
-        '</head>',
-        '<body>',
-    ]
-    
-    current_size = sum(len(p.encode('utf-8')) for p in html_parts)
-    
-    while current_size < max_bytes * 0.9:
-        element_type = random.choice(['h1', 'h2', 'h3', 'p', 'div', 'ul', 'table'])
+    while len(buf) < max_bytes * 0.9:
+        element_type = random.choice(_HTML_ELEMENTS)
         
-        if element_type in ['h1', 'h2', 'h3']:
+        if element_type in _HTML_HEADINGS:
             content = f'    <{element_type}>{random_sentence(3, 8)}</{element_type}>'
         elif element_type == 'p':
             content = f'    <p>{random_paragraph()}</p>'
@@ -271,53 +564,48 @@ def generate_html(filepath, max_size_mb=1):
                 table_rows.append(f'<tr>{cells}</tr>')
             content = f'    <table border="1">{"".join(table_rows)}</table>'
         
-        html_parts.append(content)
-        current_size += len(content.encode('utf-8'))
-        
-        if current_size > max_bytes:
-            break
+        emit(content)
     
-    html_parts.extend(['</body>', '</html>'])
+    emit('</body>')
+    buf.extend(b'</html>')
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(html_parts))
+    return write_bytes(filepath, buf)
+
+
+_MD_ELEMENTS = ('h2', 'h3', 'paragraph', 'list', 'code', 'quote', 'link')
 
 
 def generate_md(filepath, max_size_mb=1):
     """Generate a random Markdown file."""
     max_bytes = int(max_size_mb * 1024 * 1024)
     
-    content_parts = [f"# {random_sentence(3, 6)}\n\n"]
-    current_size = len(content_parts[0].encode('utf-8'))
-    
-    while current_size < max_bytes:
-        element_type = random.choice(['h2', 'h3', 'paragraph', 'list', 'code', 'quote', 'link'])
-        
-        if element_type == 'h2':
-            content = f"## {random_sentence(2, 5)}\n\n"
-        elif element_type == 'h3':
-            content = f"### {random_sentence(2, 4)}\n\n"
-        elif element_type == 'paragraph':
-            content = f"{random_paragraph()}\n\n"
-        elif element_type == 'list':
-            items = '\n'.join(f"- {random_sentence()}" for _ in range(random.randint(2, 6)))
-            content = f"{items}\n\n"
-        elif element_type == 'code':
-            code_content = '\n'.join(f"    {random_word()} = {random.randint(1, 100)}" for _ in range(random.randint(2, 5)))
-            content = f"```\n{code_content}\n```\n\n"
-        elif element_type == 'quote':
-            content = f"> {random_sentence()}\n\n"
-        else:  # link
-            content = f"[{random_word()}](https://{random_word()}.com/{random_word()})\n\n"
+    def elements():
+        yield f"# {random_sentence(3, 6)}\n\n"
         
-        content_parts.append(content)
-        current_size += len(content.encode('utf-8'))
-        
-        if current_size > max_bytes:
-            break
+        while True:
+            element_type = random.choice(_MD_ELEMENTS)
+            
+            if element_type == 'h2':
+                yield f"## {random_sentence(2, 5)}\n\n"
+            elif element_type == 'h3':
+                yield f"### {random_sentence(2, 4)}\n\n"
+            elif element_type == 'paragraph':
+                yield f"{random_paragraph()}\n\n"
+            elif element_type == 'list':
+                items = '\n'.join(f"- {random_sentence()}" for _ in range(random.randint(2, 6)))
+                yield f"{items}\n\n"
+            elif element_type == 'code':
+                code_content = '\n'.join(f"    {random_word()} = {random.randint(1, 100)}" for _ in range(random.randint(2, 5)))
+                yield f"```\n{code_content}\n```\n\n"
+            elif element_type == 'quote':
+                yield f"> {random_sentence()}\n\n"
+            else:  # link
+                yield f"[{random_word()}](https://{random_word()}.com/{random_word()})\n\n"
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(''.join(content_parts))
+    return write_text_stream(filepath, max_bytes, elements())
+
+
+_PNG_SHAPES = ('rectangle', 'ellipse', 'line', 'polygon')
 
 
 def generate_png(filepath, max_size_mb=1):
@@ -335,7 +623,7 @@ def generate_png(filepath, max_size_mb=1):
     # Draw random shapes
     num_shapes = random.randint(5, 50)
     for _ in range(num_shapes):
-        shape_type = random.choice(['rectangle', 'ellipse', 'line', 'polygon'])
+        shape_type = random.choice(_PNG_SHAPES)
         color = random_color()
         
         if shape_type == 'rectangle':
@@ -359,11 +647,14 @@ def generate_png(filepath, max_size_mb=1):
         text = random_word().upper()
         x = random.randint(0, max(1, width - 100))
         y = random.randint(0, max(1, height - 50))
-        draw.text((x, y), text, fill=random_color())
+        draw.text((x, y), text, fill=random_color(), font=_default_font())
     
     img.save(filepath, 'PNG')
 
 
+_JPG_PATTERNS = ('gradient', 'noise', 'shapes')
+
+
 def generate_jpg(filepath, max_size_mb=1):
     """Generate a random JPEG image."""
     max_pixels = int(max_size_mb * 1024 * 1024 / 3)
@@ -376,26 +667,21 @@ def generate_jpg(filepath, max_size_mb=1):
     draw = ImageDraw.Draw(img)
     
     # Create gradient or pattern
-    pattern_type = random.choice(['gradient', 'noise', 'shapes'])
+    pattern_type = random.choice(_JPG_PATTERNS)
     
     if pattern_type == 'gradient':
-        for x in range(width):
-            r = int(255 * x / width)
-            g = int(255 * (1 - x / width))
-            b = random.randint(0, 255)
-            for y in range(height):
-                img.putpixel((x, y), (r, g, int(b * y / height)))
+        # Red/green fade across the width; each column fades to its own random blue
+        xs = np.arange(width)
+        ys = np.arange(height)[:, None]
+        arr = np.empty((height, width, 3), dtype=np.uint8)
+        arr[:, :, 0] = (255 * xs / width).astype(np.uint8)
+        arr[:, :, 1] = (255 * (1 - xs / width)).astype(np.uint8)
+        arr[:, :, 2] = (_rng.integers(0, 256, size=width) * ys / height).astype(np.uint8)
+        img = Image.fromarray(arr)
     elif pattern_type == 'noise':
-        for x in range(0, width, 2):
-            for y in range(0, height, 2):
-                color = random_color()
-                img.putpixel((x, y), color)
-                if x + 1 < width:
-                    img.putpixel((x + 1, y), color)
-                if y + 1 < height:
-                    img.putpixel((x, y + 1), color)
-                if x + 1 < width and y + 1 < height:
-                    img.putpixel((x + 1, y + 1), color)
+        # Random 2x2 pixel blocks, expanded from a half-resolution array
+        blocks = _rng.integers(0, 256, ((height + 1) // 2, (width + 1) // 2, 3), dtype=np.uint8)
+        img = Image.fromarray(blocks.repeat(2, axis=0).repeat(2, axis=1)[:height, :width])
     else:  # shapes
         for _ in range(random.randint(10, 100)):
             x1, y1 = random.randint(0, width), random.randint(0, height)
@@ -405,27 +691,42 @@ def generate_jpg(filepath, max_size_mb=1):
     img.save(filepath, 'JPEG', quality=random.randint(60, 95))
 
 
+_GIF_SHAPES = ('rectangle', 'ellipse')
+
+
 def generate_gif(filepath, max_size_mb=1):
     """Generate a random animated GIF."""
     width = random.randint(100, 500)
     height = random.randint(100, 500)
     num_frames = random.randint(3, 15)
     
+    # Draw palette-indexed frames directly so saving needs no quantization
+    palette = _rng.integers(0, 256, size=256 * 3, dtype=np.uint8).tobytes()
+    
     frames = []
     for _ in range(num_frames):
-        img = Image.new('RGB', (width, height), random_color())
-        draw = ImageDraw.Draw(img)
+        arr = np.full((height, width), random.randrange(256), dtype=np.uint8)
         
         # Draw random shapes on each frame
         for _ in range(random.randint(3, 15)):
-            x1, y1 = random.randint(0, width), random.randint(0, height)
-            x2, y2 = random.randint(0, width), random.randint(0, height)
-            shape = random.choice(['rectangle', 'ellipse'])
+            x1, y1 = random.randrange(width), random.randrange(height)
+            x2, y2 = random.randrange(width), random.randrange(height)
+            left, right = min(x1, x2), max(x1, x2)
+            top, bottom = min(y1, y2), max(y1, y2)
+            region = arr[top:bottom + 1, left:right + 1]
+            color = random.randrange(256)
+            shape = random.choice(_GIF_SHAPES)
             if shape == 'rectangle':
-                draw.rectangle([min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)], fill=random_color())
+                region[...] = color
             else:
-                draw.ellipse([min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)], fill=random_color())
+                ys, xs = np.ogrid[top:bottom + 1, left:right + 1]
+                rx = max((right - left) / 2, 0.5)
+                ry = max((bottom - top) / 2, 0.5)
+                mask = ((xs - (left + right) / 2) / rx) ** 2 + ((ys - (top + bottom) / 2) / ry) ** 2 <= 1
+                region[mask] = color
         
+        img = Image.fromarray(arr)
+        img.putpalette(palette)
         frames.append(img)
     
     frames[0].save(
@@ -433,10 +734,15 @@ def generate_gif(filepath, max_size_mb=1):
         save_all=True,
         append_images=frames[1:],
         duration=random.randint(100, 500),
-        loop=0
+        loop=0,
+        optimize=False,
+        disposal=2
     )
 
 
+_BMP_PATTERNS = ('stripes', 'checkerboard', 'random')
+
+
 def generate_bmp(filepath, max_size_mb=1):
     """Generate a random BMP image."""
     max_pixels = int(max_size_mb * 1024 * 1024 / 3)
@@ -445,24 +751,27 @@ def generate_bmp(filepath, max_size_mb=1):
     width = random.randint(min(100, side), side)
     height = random.randint(min(100, side), side)
     
-    img = Image.new('RGB', (width, height), random_color())
-    draw = ImageDraw.Draw(img)
+    background = random_color()
     
     # Draw stripes or checkerboard
-    pattern = random.choice(['stripes', 'checkerboard', 'random'])
+    pattern = random.choice(_BMP_PATTERNS)
     
     if pattern == 'stripes':
+        # Build one row of vertical stripes and repeat it down the image
         stripe_width = random.randint(5, 50)
-        for i in range(0, width, stripe_width * 2):
-            draw.rectangle([i, 0, i + stripe_width, height], fill=random_color())
+        xs = np.arange(width)
+        colors = np.array([random_color() for _ in range(0, width, stripe_width * 2)], dtype=np.uint8)
+        in_stripe = (xs % (stripe_width * 2) <= stripe_width)[:, None]
+        row = np.where(in_stripe, colors[xs // (stripe_width * 2)], np.array(background, dtype=np.uint8))
+        img = Image.fromarray(np.ascontiguousarray(np.broadcast_to(row, (height, width, 3))))
     elif pattern == 'checkerboard':
         cell_size = random.randint(10, 50)
         color1, color2 = random_color(), random_color()
-        for x in range(0, width, cell_size):
-            for y in range(0, height, cell_size):
-                color = color1 if ((x // cell_size) + (y // cell_size)) % 2 == 0 else color2
-                draw.rectangle([x, y, x + cell_size, y + cell_size], fill=color)
+        parity = (np.arange(height)[:, None] // cell_size + np.arange(width) // cell_size) % 2
+        img = Image.fromarray(np.where(parity[:, :, None] == 0, color1, color2).astype(np.uint8))
     else:
+        img = Image.new('RGB', (width, height), background)
+        draw = ImageDraw.Draw(img)
         for _ in range(random.randint(20, 100)):
             x1, y1 = random.randint(0, width), random.randint(0, height)
             x2, y2 = random.randint(0, width), random.randint(0, height)
@@ -471,54 +780,78 @@ def generate_bmp(filepath, max_size_mb=1):
     img.save(filepath, 'BMP')
 
 
+# Line templates for generate_svg, filled with %-formatting
+_SVG_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<svg xmlns="http://www.w3.org/2000/svg" width="%d" height="%d" viewBox="0 0 %d %d">\n'
+    '  <rect width="100%%" height="100%%" fill="%s"/>\n'
+)
+_SVG_RECT = '  <rect x="%d" y="%d" width="%d" height="%d" fill="%s" opacity="%.2f"/>\n'
+_SVG_CIRCLE = '  <circle cx="%d" cy="%d" r="%d" fill="%s" opacity="%.2f"/>\n'
+_SVG_ELLIPSE = '  <ellipse cx="%d" cy="%d" rx="%d" ry="%d" fill="%s" opacity="%.2f"/>\n'
+_SVG_LINE = '  <line x1="%d" y1="%d" x2="%d" y2="%d" stroke="%s" stroke-width="%d"/>\n'
+_SVG_POLYGON = '  <polygon points="%s" fill="%s" opacity="%.2f"/>\n'
+_SVG_TEXT = '  <text x="%d" y="%d" font-size="%d" fill="%s">%s</text>\n'
+
+_SVG_SHAPES = ('rect', 'circle', 'ellipse', 'line', 'polygon', 'text')
+
+
 def generate_svg(filepath, max_size_mb=1):
     """Generate a random SVG file."""
     width = random.randint(200, 1000)
     height = random.randint(200, 1000)
     
-    svg_parts = [
-        f'<?xml version="1.0" encoding="UTF-8"?>',
-        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">',
-        f'  <rect width="100%" height="100%" fill="{random_hex_color()}"/>',
-    ]
+    # Lines are encoded straight into one growing buffer
+    buf = bytearray()
+    
+    def emit(template, *args):
+        buf.extend((template % args).encode('utf-8'))
+    
+    emit(_SVG_HEADER, width, height, width, height, random_hex_color())
     
     num_shapes = random.randint(10, 100)
     for _ in range(num_shapes):
-        shape_type = random.choice(['rect', 'circle', 'ellipse', 'line', 'polygon', 'text'])
+        shape_type = random.choice(_SVG_SHAPES)
         
         if shape_type == 'rect':
             x, y = random.randint(0, width), random.randint(0, height)
             w, h = random.randint(10, 200), random.randint(10, 200)
-            svg_parts.append(f'  <rect x="{x}" y="{y}" width="{w}" height="{h}" fill="{random_hex_color()}" opacity="{random.uniform(0.3, 1):.2f}"/>')
+            emit(_SVG_RECT, x, y, w, h, random_hex_color(), random.uniform(0.3, 1))
         elif shape_type == 'circle':
             cx, cy = random.randint(0, width), random.randint(0, height)
             r = random.randint(10, 100)
-            svg_parts.append(f'  <circle cx="{cx}" cy="{cy}" r="{r}" fill="{random_hex_color()}" opacity="{random.uniform(0.3, 1):.2f}"/>')
+            emit(_SVG_CIRCLE, cx, cy, r, random_hex_color(), random.uniform(0.3, 1))
         elif shape_type == 'ellipse':
             cx, cy = random.randint(0, width), random.randint(0, height)
             rx, ry = random.randint(10, 100), random.randint(10, 100)
-            svg_parts.append(f'  <ellipse cx="{cx}" cy="{cy}" rx="{rx}" ry="{ry}" fill="{random_hex_color()}" opacity="{random.uniform(0.3, 1):.2f}"/>')
+            emit(_SVG_ELLIPSE, cx, cy, rx, ry, random_hex_color(), random.uniform(0.3, 1))
         elif shape_type == 'line':
             x1, y1 = random.randint(0, width), random.randint(0, height)
             x2, y2 = random.randint(0, width), random.randint(0, height)
-            svg_parts.append(f'  <line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" stroke="{random_hex_color()}" stroke-width="{random.randint(1, 10)}"/>')
+            emit(_SVG_LINE, x1, y1, x2, y2, random_hex_color(), random.randint(1, 10))
         elif shape_type == 'polygon':
-            points = ' '.join(f"{random.randint(0, width)},{random.randint(0, height)}" for _ in range(random.randint(3, 8)))
-            svg_parts.append(f'  <polygon points="{points}" fill="{random_hex_color()}" opacity="{random.uniform(0.3, 1):.2f}"/>')
+            points = ' '.join('%d,%d' % (random.randint(0, width), random.randint(0, height)) for _ in range(random.randint(3, 8)))
+            emit(_SVG_POLYGON, points, random_hex_color(), random.uniform(0.3, 1))
         else:  # text
             x, y = random.randint(0, width), random.randint(20, height)
             font_size = random.randint(12, 48)
-            svg_parts.append(f'  <text x="{x}" y="{y}" font-size="{font_size}" fill="{random_hex_color()}">{random_word()}</text>')
+            emit(_SVG_TEXT, x, y, font_size, random_hex_color(), random_word())
     
-    svg_parts.append('</svg>')
+    buf.extend(b'</svg>')
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(svg_parts))
+    return write_bytes(filepath, buf)
+
+
+_PDF_PAGE_SIZES = (letter, A4)
+_PDF_SHAPES = ('rect', 'circle', 'line')
 
 
 def generate_pdf(filepath, max_size_mb=1):
     """Generate a random PDF file."""
-    c = canvas.Canvas(filepath, pagesize=random.choice([letter, A4]))
+    buf = io.BytesIO()
+    # Invariant mode replaces the embedded creation date and document ID
+    # with fixed values, so seeded runs produce identical files
+    c = canvas.Canvas(buf, pagesize=random.choice(_PDF_PAGE_SIZES), invariant=_fixed_clock)
     page_width, page_height = letter
     
     num_pages = random.randint(1, max(1, int(max_size_mb * 5)))
@@ -533,20 +866,22 @@ def generate_pdf(filepath, max_size_mb=1):
         c.setFont("Helvetica-Bold", random.randint(18, 36))
         c.drawString(50, page_height - 50, random_sentence(3, 6))
         
-        # Random text blocks
-        y_position = page_height - 100
-        c.setFont("Helvetica", random.randint(10, 14))
-        
-        while y_position > 100:
-            c.setFillColor(HexColor(random_hex_color()))
-            text = random_sentence()
-            c.drawString(50, y_position, text[:80])  # Truncate long sentences
-            y_position -= random.randint(15, 30)
+        # Random text block, emitted as a single text object with a color per line
+        leading = random.randint(15, 30)
+        num_lines = int((page_height - 200) // leading) + 1
+        text = c.beginText(50, page_height - 100)
+        text.setFont("Helvetica", random.randint(10, 14), leading)
+        for _ in range(num_lines):
+            text.setFillColor(HexColor(random_hex_color()))
+            text.textLine(random_sentence()[:80])  # Truncate long sentences
+        c.drawText(text)
         
         # Random shapes
+        # Only filled shapes need a fill color; lines set just their stroke
         for _ in range(random.randint(3, 15)):
-            c.setFillColor(HexColor(random_hex_color()))
-            shape = random.choice(['rect', 'circle', 'line'])
+            shape = random.choice(_PDF_SHAPES)
+            if shape != 'line':
+                c.setFillColor(HexColor(random_hex_color()))
             if shape == 'rect':
                 x, y = random.randint(0, int(page_width)), random.randint(0, int(page_height))
                 w, h = random.randint(20, 150), random.randint(20, 150)
@@ -569,60 +904,65 @@ def generate_pdf(filepath, max_size_mb=1):
             c.showPage()
     
     c.save()
+    return write_bytes(filepath, buf.getbuffer())
+
+
+# openpyxl style objects are immutable, so every header cell can share one
+_HEADER_FONT = Font(bold=True)
+
+_XLSX_KINDS = ('string', 'int', 'float', 'date', 'formula')
 
 
 def generate_xlsx(filepath, max_size_mb=1):
     """Generate a random Excel file."""
-    wb = Workbook()
+    # Write-only mode streams rows to the sheet XML instead of keeping Cell objects
+    wb = Workbook(write_only=True)
     
     num_sheets = random.randint(1, 5)
     
-    for sheet_idx in range(num_sheets):
-        if sheet_idx == 0:
-            ws = wb.active
-            ws.title = random_word().capitalize()
-        else:
-            ws = wb.create_sheet(title=random_word().capitalize())
+    for _ in range(num_sheets):
+        ws = wb.create_sheet(title=random_word().capitalize())
         
         num_rows = random.randint(10, 100)
         num_cols = random.randint(3, 15)
         
         # Header row
-        for col in range(1, num_cols + 1):
-            cell = ws.cell(row=1, column=col, value=random_word().capitalize())
-            cell.font = Font(bold=True)
+        header = []
+        for _ in range(num_cols):
+            cell = WriteOnlyCell(ws, value=random_word().capitalize())
+            cell.font = _HEADER_FONT
             cell.fill = PatternFill(start_color=random_hex_color()[1:], end_color=random_hex_color()[1:], fill_type="solid")
+            header.append(cell)
+        ws.append(header)
         
-        # Data rows
-        for row in range(2, num_rows + 1):
-            for col in range(1, num_cols + 1):
-                cell_type = random.choice(['string', 'int', 'float', 'date', 'formula'])
-                if cell_type == 'string':
-                    ws.cell(row=row, column=col, value=random_word())
-                elif cell_type == 'int':
-                    ws.cell(row=row, column=col, value=random.randint(-10000, 10000))
-                elif cell_type == 'float':
-                    ws.cell(row=row, column=col, value=round(random.uniform(-1000, 1000), 2))
-                elif cell_type == 'date':
-                    ws.cell(row=row, column=col, value=random_date())
-                else:  # formula
-                    if row > 2:
-                        ws.cell(row=row, column=col, value=f"=A{row-1}+1")
-                    else:
-                        ws.cell(row=row, column=col, value=random.randint(1, 100))
+        # Data rows, built one column at a time
+        columns = []
+        for _ in range(num_cols):
+            cell_type = random.choice(_XLSX_KINDS)
+            if cell_type == 'formula':
+                columns.append([random.randint(1, 100)] + [f"=A{row - 1}+1" for row in range(3, num_rows + 1)])
+            else:
+                column = generate_column(cell_type, num_rows - 1)
+                columns.append(column if isinstance(column, list) else column.tolist())
+        
+        for row in zip(*columns):
+            ws.append(row)
     
     wb.save(filepath)
 
 
+_PPTX_SHAPES = ('rectangle', 'oval', 'textbox')
+
+
 def generate_pptx(filepath, max_size_mb=1):
     """Generate a random PowerPoint file."""
     prs = Presentation()
+    layouts = list(prs.slide_layouts)[:7]
     
     num_slides = random.randint(3, 15)
     
     for _ in range(num_slides):
-        slide_layout = prs.slide_layouts[random.randint(0, min(6, len(prs.slide_layouts) - 1))]
-        slide = prs.slides.add_slide(slide_layout)
+        slide = prs.slides.add_slide(random.choice(layouts))
         
         # Try to set title if available
         if slide.shapes.title:
@@ -630,7 +970,7 @@ def generate_pptx(filepath, max_size_mb=1):
         
         # Add random shapes
         for _ in range(random.randint(2, 8)):
-            shape_type = random.choice(['rectangle', 'oval', 'textbox'])
+            shape_type = random.choice(_PPTX_SHAPES)
             
             left = Inches(random.uniform(0.5, 8))
             top = Inches(random.uniform(1, 6))
@@ -652,31 +992,41 @@ def generate_pptx(filepath, max_size_mb=1):
     prs.save(filepath)
 
 
+_DOCX_SECTIONS = ('heading', 'paragraph', 'list', 'table')
+
+
 def generate_docx(filepath, max_size_mb=1):
     """Generate a random Word document."""
     doc = Document()
     
+    # Resolve styles once per document; passing a name to add_paragraph
+    # rescans the whole style table on every call
+    styles = doc.styles
+    title_style = styles['Title']
+    heading_styles = tuple(styles[f'Heading {level}'] for level in range(1, 4))
+    bullet_style = styles['List Bullet']
+    table_style = styles['Table Grid']
+    
     # Title
-    doc.add_heading(random_sentence(3, 7), 0)
+    doc.add_paragraph(random_sentence(3, 7), style=title_style)
     
     num_sections = random.randint(5, 20)
     
     for _ in range(num_sections):
-        section_type = random.choice(['heading', 'paragraph', 'list', 'table'])
+        section_type = random.choice(_DOCX_SECTIONS)
         
         if section_type == 'heading':
-            level = random.randint(1, 3)
-            doc.add_heading(random_sentence(2, 5), level)
+            doc.add_paragraph(random_sentence(2, 5), style=random.choice(heading_styles))
         elif section_type == 'paragraph':
             doc.add_paragraph(random_paragraph())
         elif section_type == 'list':
             for _ in range(random.randint(2, 6)):
-                doc.add_paragraph(random_sentence(), style='List Bullet')
+                doc.add_paragraph(random_sentence(), style=bullet_style)
         else:  # table
             rows = random.randint(2, 6)
             cols = random.randint(2, 5)
             table = doc.add_table(rows=rows, cols=cols)
-            table.style = 'Table Grid'
+            table.style = table_style
             for row in table.rows:
                 for cell in row.cells:
                     cell.text = random_word()
@@ -684,6 +1034,10 @@ def generate_docx(filepath, max_size_mb=1):
     doc.save(filepath)
 
 
+_SQLITE_VALUE_KINDS = ('string', 'int', 'float')
+_SQLITE_COLUMN_TYPES = ('TEXT', 'INTEGER', 'REAL')
+
+
 def generate_sqlite(filepath, max_size_mb=1):
     """Generate a random SQLite database."""
     if os.path.exists(filepath):
@@ -692,6 +1046,27 @@ def generate_sqlite(filepath, max_size_mb=1):
     conn = sqlite3.connect(filepath)
     cursor = conn.cursor()
     
+    # Nothing to recover if generation is interrupted, so skip durability work
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    
+    # One explicit transaction for the schema and all rows; sqlite3 would
+    # otherwise autocommit each CREATE TABLE before the first INSERT
+    cursor.execute("BEGIN")
+    
+    def random_row(num_cols):
+        values = []
+        for _ in range(num_cols):
+            val_type = random.choice(_SQLITE_VALUE_KINDS)
+            if val_type == 'string':
+                values.append(random_word())
+            elif val_type == 'int':
+                values.append(random.randint(-10000, 10000))
+            else:
+                values.append(round(random.uniform(-1000, 1000), 2))
+        return tuple(values)
+    
     num_tables = random.randint(2, 5)
     
     for table_idx in range(num_tables):
@@ -703,53 +1078,51 @@ def generate_sqlite(filepath, max_size_mb=1):
         for col_idx in range(num_cols):
             col_name = f"{random_word()}_{col_idx}"
             col_names.append(col_name)
-            col_type = random.choice(['TEXT', 'INTEGER', 'REAL'])
+            col_type = random.choice(_SQLITE_COLUMN_TYPES)
             columns.append(f"{col_name} {col_type}")
         
         create_sql = f"CREATE TABLE {table_name} (id INTEGER PRIMARY KEY, {', '.join(columns)})"
         cursor.execute(create_sql)
         
-        # Insert data
+        # Insert data with one prepared statement
         num_rows = random.randint(50, 500)
-        for _ in range(num_rows):
-            values = []
-            for col_name in col_names:
-                val_type = random.choice(['string', 'int', 'float'])
-                if val_type == 'string':
-                    values.append(f"'{random_word()}'")
-                elif val_type == 'int':
-                    values.append(str(random.randint(-10000, 10000)))
-                else:
-                    values.append(str(round(random.uniform(-1000, 1000), 2)))
-            
-            insert_sql = f"INSERT INTO {table_name} ({', '.join(col_names)}) VALUES ({', '.join(values)})"
-            cursor.execute(insert_sql)
+        placeholders = ', '.join('?' * num_cols)
+        insert_sql = f"INSERT INTO {table_name} ({', '.join(col_names)}) VALUES ({placeholders})"
+        cursor.executemany(insert_sql, (random_row(num_cols) for _ in range(num_rows)))
     
     conn.commit()
     conn.close()
 
 
+_PARQUET_KINDS = ('string', 'int', 'float', 'bool')
+
+
 def generate_parquet(filepath, max_size_mb=1):
     """Generate a random Parquet file."""
     num_rows = random.randint(100, 10000)
     num_cols = random.randint(3, 10)
     
-    data = {}
+    # Build Arrow columns straight from NumPy arrays, skipping pandas
+    columns = {}
     for col_idx in range(num_cols):
         col_name = f"{random_word()}_{col_idx}"
-        col_type = random.choice(['string', 'int', 'float', 'bool'])
+        col_type = random.choice(_PARQUET_KINDS)
         
         if col_type == 'string':
-            data[col_name] = [random_word() for _ in range(num_rows)]
+            words = pa.array(random_words(min(num_rows, 1024)))
+            indices = _rng.integers(0, len(words), size=num_rows, dtype=np.int32)
+            columns[col_name] = pa.DictionaryArray.from_arrays(indices, words)
         elif col_type == 'int':
-            data[col_name] = [random.randint(-10000, 10000) for _ in range(num_rows)]
+            columns[col_name] = pa.array(_rng.integers(-10000, 10001, size=num_rows))
         elif col_type == 'float':
-            data[col_name] = [round(random.uniform(-1000, 1000), 2) for _ in range(num_rows)]
+            columns[col_name] = pa.array(np.round(_rng.uniform(-1000, 1000, size=num_rows), 2))
         else:
-            data[col_name] = [random.choice([True, False]) for _ in range(num_rows)]
+            columns[col_name] = pa.array(_rng.integers(0, 2, size=num_rows, dtype=bool))
     
-    df = pd.DataFrame(data)
-    df.to_parquet(filepath, index=False)
+    pq.write_table(pa.table(columns), filepath, compression='snappy')
+
+
+_WAV_TYPES = ('sine', 'noise', 'mixed')
 
 
 def generate_wav(filepath, max_size_mb=1):
@@ -761,77 +1134,112 @@ def generate_wav(filepath, max_size_mb=1):
     num_samples = int(sample_rate * duration)
     
     # Generate audio
-    audio_type = random.choice(['sine', 'noise', 'mixed'])
+    audio_type = random.choice(_WAV_TYPES)
     
-    with wave.open(filepath, 'w') as wav_file:
+    # Build the whole PCM buffer with vectorized NumPy operations
+    if audio_type == 'noise':
+        # Any byte pattern is a valid 16-bit sample, so raw random bytes are
+        # already uniform noise
+        frames = _rng.bytes(2 * num_samples)
+    else:
+        t = np.arange(num_samples, dtype=np.float32) / sample_rate
+        if audio_type == 'sine':
+            signal = 0.5 * np.sin(2 * np.pi * random.uniform(200, 2000) * t)
+        else:  # mixed
+            signal = 0.5 * np.sin(2 * np.pi * random.uniform(200, 1000) * t)
+            signal += _rng.uniform(-0.3, 0.3, size=num_samples)
+            np.clip(signal, -1, 1, out=signal)
+        frames = (signal * 32767).astype('<i2').tobytes()
+    
+    # The PCM header is 44 bytes, so the final size is known exactly
+    with _open_preallocated(filepath, 44 + len(frames)) as f, wave.open(f, 'wb') as wav_file:
         wav_file.setnchannels(1)  # Mono
         wav_file.setsampwidth(2)  # 2 bytes per sample
         wav_file.setframerate(sample_rate)
-        
-        for i in range(num_samples):
-            if audio_type == 'sine':
-                frequency = random.uniform(200, 2000)
-                value = int(32767 * 0.5 * (1 + (i * frequency / sample_rate % 1)))
-            elif audio_type == 'noise':
-                value = random.randint(-32767, 32767)
-            else:  # mixed
-                frequency = random.uniform(200, 1000)
-                sine_val = 0.5 * (1 + (i * frequency / sample_rate % 1))
-                noise_val = random.uniform(-0.3, 0.3)
-                value = int(32767 * (sine_val + noise_val))
-                value = max(-32767, min(32767, value))
-            
-            wav_file.writeframes(struct.pack('<h', value))
+        wav_file.writeframes(frames)
+    
+    return 44 + len(frames)
+
+
+# Entries smaller than this are stored rather than deflated; the saving on a
+# few hundred bytes of random text is not worth a zlib pass
+_ZIP_STORE_BELOW = 1024
+
+_ZIP_ENTRY_TYPES = ('txt', 'json', 'csv')
 
 
 def generate_zip(filepath, max_size_mb=1):
     """Generate a random ZIP archive."""
-    with zipfile.ZipFile(filepath, 'w', zipfile.ZIP_DEFLATED) as zf:
+    buf = io.BytesIO()
+    # Entries are stamped with the run's reference time rather than the
+    # moment each one is written
+    date_time = _clock.timetuple()[:6]
+    
+    with zipfile.ZipFile(buf, 'w') as zf:
         num_files = random.randint(3, 15)
         
-        for _ in range(num_files):
-            file_type = random.choice(['txt', 'json', 'csv'])
-            inner_filename = f"{random_filename()}.{file_type}"
+        for name in random_filenames_batch(num_files):
+            file_type = random.choice(_ZIP_ENTRY_TYPES)
+            inner_filename = f"{name}.{file_type}"
             
             if file_type == 'txt':
                 content = random_paragraph()
             elif file_type == 'json':
-                content = json.dumps({random_word(): random_sentence() for _ in range(random.randint(2, 10))})
+                content = json_dumps({random_word(): random_sentence() for _ in range(random.randint(2, 10))})
             else:  # csv
                 rows = [','.join(random_word() for _ in range(random.randint(3, 6))) for _ in range(random.randint(5, 20))]
                 content = '\n'.join(rows)
             
-            zf.writestr(inner_filename, content)
+            info = zipfile.ZipInfo(inner_filename, date_time=date_time)
+            info.external_attr = 0o600 << 16  # rw-------, as writestr gives named entries
+            if len(content) < _ZIP_STORE_BELOW:
+                zf.writestr(info, content, compress_type=zipfile.ZIP_STORED)
+            else:
+                # Random text gains little from higher DEFLATE levels, so use the fastest
+                zf.writestr(info, content, compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
+    
+    return write_bytes(filepath, buf.getbuffer())
+
+
+# Log levels, padded to a fixed column width
+_LOG_LEVELS = np.array([f"{level:8}" for level in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')], dtype=object)
+
+# Number of log lines whose timestamps, levels and modules are drawn together
+_LOG_BLOCK_LINES = 4096
 
 
 def generate_log(filepath, max_size_mb=1):
     """Generate a random log file."""
     max_bytes = int(max_size_mb * 1024 * 1024)
     
-    log_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-    modules = [random_word() for _ in range(5)]
+    modules = np.array(random_words(5), dtype=object)
     
-    content = []
-    current_size = 0
-    
-    current_time = datetime.now() - timedelta(days=random.randint(1, 30))
-    
-    while current_size < max_bytes:
-        current_time += timedelta(seconds=random.randint(1, 300))
-        timestamp = current_time.strftime('%Y-%m-%d %H:%M:%S')
-        level = random.choice(log_levels)
-        module = random.choice(modules)
-        message = random_sentence()
-        
-        line = f"[{timestamp}] {level:8} {module}: {message}\n"
-        content.append(line)
-        current_size += len(line.encode('utf-8'))
+    def lines():
+        current_time = np.datetime64(_clock - timedelta(days=random.randint(1, 30)), 's')
         
-        if current_size > max_bytes:
-            break
+        while True:
+            # Draw a block of lines at a time; timestamps advance by the
+            # running sum of 1-300 second steps
+            steps = _rng.integers(1, 301, size=_LOG_BLOCK_LINES)
+            times = current_time + np.cumsum(steps).astype('timedelta64[s]')
+            current_time = times[-1]
+            
+            timestamps = np.datetime_as_string(times).tolist()
+            levels = _LOG_LEVELS[_rng.integers(0, len(_LOG_LEVELS), size=_LOG_BLOCK_LINES)].tolist()
+            line_modules = modules[_rng.integers(0, len(modules), size=_LOG_BLOCK_LINES)].tolist()
+            
+            for timestamp, level, module in zip(timestamps, levels, line_modules):
+                message = random_sentence()
+                yield f"[{timestamp[:10]} {timestamp[11:]}] {level} {module}: {message}\n"
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(''.join(content))
+    return write_text_stream(filepath, max_bytes, lines())
+
+
+# Indentation strings for each YAML nesting level, built once. Values nest at
+# most five levels deep, so this covers every line with room to spare.
+_YAML_INDENT = tuple("  " * level for level in range(16))
+
+_YAML_TYPES = ('string', 'int', 'float', 'bool', 'list', 'dict')
 
 
 def generate_yaml(filepath, max_size_mb=1):
@@ -840,7 +1248,7 @@ def generate_yaml(filepath, max_size_mb=1):
         if depth > 3:
             return random_word()
         
-        value_type = random.choice(['string', 'int', 'float', 'bool', 'list', 'dict'])
+        value_type = random.choice(_YAML_TYPES)
         if value_type == 'string':
             return random_sentence()
         elif value_type == 'int':
@@ -848,100 +1256,118 @@ def generate_yaml(filepath, max_size_mb=1):
         elif value_type == 'float':
             return round(random.uniform(-1000, 1000), 2)
         elif value_type == 'bool':
-            return random.choice([True, False])
+            return random.getrandbits(1) == 1
         elif value_type == 'list':
             return [random_yaml_value(depth + 1) for _ in range(random.randint(1, 4))]
         else:
             return {random_word(): random_yaml_value(depth + 1) for _ in range(random.randint(1, 4))}
     
-    # Build YAML manually to avoid dependency
-    def to_yaml(data, indent=0):
-        lines = []
-        prefix = "  " * indent
-        
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if isinstance(value, (dict, list)):
-                    lines.append(f"{prefix}{key}:")
-                    lines.extend(to_yaml(value, indent + 1))
-                else:
-                    lines.append(f"{prefix}{key}: {value}")
-        elif isinstance(data, list):
-            for item in data:
-                if isinstance(item, (dict, list)):
-                    lines.append(f"{prefix}-")
-                    lines.extend(to_yaml(item, indent + 1))
-                else:
-                    lines.append(f"{prefix}- {item}")
-        else:
-            lines.append(f"{prefix}{data}")
-        
-        return lines
+    # Build YAML manually to avoid dependency. Every level writes its lines
+    # straight to the output file, whose buffer collects them. Containers are
+    # told apart by an exact-type lookup into the writer table below.
+    def yaml_dict(data, indent, out):
+        prefix = _YAML_INDENT[indent]
+        for key, value in data.items():
+            write_child = writers.get(type(value))
+            if write_child:
+                out.write(f"{prefix}{key}:\n")
+                write_child(value, indent + 1, out)
+            else:
+                out.write(f"{prefix}{key}: {value}\n")
+    
+    def yaml_list(data, indent, out):
+        prefix = _YAML_INDENT[indent]
+        for item in data:
+            write_child = writers.get(type(item))
+            if write_child:
+                out.write(f"{prefix}-\n")
+                write_child(item, indent + 1, out)
+            else:
+                out.write(f"{prefix}- {item}\n")
+    
+    writers = {dict: yaml_dict, list: yaml_list}
     
     data = {random_word(): random_yaml_value() for _ in range(random.randint(5, 15))}
-    content = '\n'.join(to_yaml(data))
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    with _open_write(filepath) as f:
+        yaml_dict(data, 0, f)
+        return f.tell()
+
+
+_INI_KINDS = np.array(['string', 'int', 'float', 'bool', 'path'], dtype=object)
+_INI_BOOLS = np.array(['true', 'false', 'yes', 'no', '1', '0'], dtype=object)
+_INI_OPTION = "%s = %s\n"
 
 
 def generate_ini(filepath, max_size_mb=1):
     """Generate a random INI configuration file."""
-    content = []
-    
     num_sections = random.randint(3, 10)
+    counts = _rng.integers(2, 9, size=num_sections)
+    num_options = int(counts.sum())
     
-    for _ in range(num_sections):
-        section_name = random_word()
-        content.append(f"[{section_name}]")
-        
-        num_options = random.randint(2, 8)
-        for _ in range(num_options):
-            key = random_word()
-            value_type = random.choice(['string', 'int', 'float', 'bool', 'path'])
-            
-            if value_type == 'string':
-                value = random_word()
-            elif value_type == 'int':
-                value = str(random.randint(0, 10000))
-            elif value_type == 'float':
-                value = f"{random.uniform(0, 100):.2f}"
-            elif value_type == 'bool':
-                value = random.choice(['true', 'false', 'yes', 'no', '1', '0'])
-            else:  # path
-                value = f"/path/to/{random_word()}/{random_word()}"
-            
-            content.append(f"{key} = {value}")
+    # Draw every option's kind and candidate values in one batch per column
+    kinds = _INI_KINDS[_rng.integers(0, len(_INI_KINDS), size=num_options)].tolist()
+    ints = _rng.integers(0, 10001, size=num_options).tolist()
+    floats = _rng.uniform(0, 100, size=num_options).tolist()
+    bools = _INI_BOOLS[_rng.integers(0, len(_INI_BOOLS), size=num_options)].tolist()
+    
+    options = []
+    for key, value_type, int_value, float_value, bool_value in zip(random_words(num_options), kinds, ints, floats, bools):
+        if value_type == 'string':
+            value = random_word()
+        elif value_type == 'int':
+            value = str(int_value)
+        elif value_type == 'float':
+            value = f"{float_value:.2f}"
+        elif value_type == 'bool':
+            value = bool_value
+        else:  # path
+            value = f"/path/to/{random_word()}/{random_word()}"
         
-        content.append("")  # Empty line between sections
+        options.append(_INI_OPTION % (key, value))
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(content))
+    # Write each section straight through the file buffer
+    with _open_write(filepath) as f:
+        for i, section in enumerate(_split_runs(options, counts)):
+            if i:
+                f.write("\n")  # Empty line between sections
+            f.write("[" + random_word() + "]\n")
+            f.writelines(section)
+        return f.tell()
+
+
+# One entry of the RTF color table, filled with an (r, g, b) tuple
+_RTF_COLOR = rb"\red%d\green%d\blue%d;"
+
+# One RTF paragraph, filled with (color index, font size, ASCII text)
+_RTF_PARAGRAPH = rb"\cf%d\fs%d %s\par "
 
 
 def generate_rtf(filepath, max_size_mb=1):
     """Generate a random RTF file."""
-    content = [r"{\rtf1\ansi\deff0"]
-    
-    # Color table
-    colors = [random_color() for _ in range(5)]
-    color_table = r"{\colortbl;" + "".join(f"\\red{c[0]}\\green{c[1]}\\blue{c[2]};" for c in colors) + "}"
-    content.append(color_table)
-    
-    num_paragraphs = random.randint(5, 30)
-    
-    for _ in range(num_paragraphs):
-        color_idx = random.randint(1, len(colors))
-        font_size = random.randint(20, 48)  # RTF font size is in half-points
+    # Pieces are written straight through the file buffer as they are made.
+    # RTF is plain ASCII, so each piece goes in as bytes and the file needs
+    # no text layer.
+    with _open_write(filepath, binary=True) as f:
+        f.write(rb"{\rtf1\ansi\deff0")
         
-        text = random_paragraph()
-        formatted_text = f"\\cf{color_idx}\\fs{font_size} {text}\\par "
-        content.append(formatted_text)
-    
-    content.append("}")
-    
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(''.join(content))
+        # Color table
+        colors = [random_color() for _ in range(5)]
+        num_colors = len(colors)
+        f.write(rb"{\colortbl;" + b"".join([_RTF_COLOR % color for color in colors]) + b"}")
+        
+        num_paragraphs = random.randint(5, 30)
+        color_idxs = _rng.integers(1, num_colors + 1, size=num_paragraphs).tolist()
+        font_sizes = _rng.integers(20, 49, size=num_paragraphs).tolist()  # RTF font size is in half-points
+        
+        # Bound once for the paragraph loop
+        write = f.write
+        
+        for color_idx, font_size in zip(color_idxs, font_sizes):
+            write(_RTF_PARAGRAPH % (color_idx, font_size, random_paragraph().encode('ascii')))
+        
+        f.write(b"}")
+        return f.tell()
 
 
 # =============================================================================
@@ -975,17 +1401,81 @@ FILE_GENERATORS = {
     'rtf': generate_rtf,
 }
 
+# Type names and their generators as parallel tuples, resolved once so a
+# random pick is a single index into both
+_FILE_TYPES, _FILE_GENERATOR_FUNCS = zip(*FILE_GENERATORS.items())
 
-def generate_random_file(output_dir, max_size_mb=1):
-    """Generate a single random file of a random type."""
-    file_type = random.choice(list(FILE_GENERATORS.keys()))
+
+def generate_random_file(output_dir, max_size_mb=1, file_type=None):
+    """
+    Generate a single random file, of a random type unless one is given.
+    
+    Returns (filepath, file_type, size_in_bytes). Generators that write
+    their own bytes report the size directly; for the rest (formats saved
+    by their libraries to a path) it is read back from the file system.
+    """
+    if file_type is None:
+        idx = random.randrange(len(_FILE_TYPES))
+        file_type, generator = _FILE_TYPES[idx], _FILE_GENERATOR_FUNCS[idx]
+    else:
+        generator = FILE_GENERATORS[file_type]
     filename = f"{random_filename()}.{file_type}"
     filepath = os.path.join(output_dir, filename)
     
-    generator = FILE_GENERATORS[file_type]
-    generator(filepath, max_size_mb)
+    size = generator(filepath, max_size_mb)
+    if size is None:
+        size = os.path.getsize(filepath)
+    
+    return filepath, file_type, size
+
+
+def seed_generators(seed, fixed_clock=False):
+    """
+    Seed the random module and the NumPy generator used by all helpers.
+    
+    With fixed_clock, log timestamps and filename dates are also taken from
+    a fixed epoch instead of the current time, making output fully
+    reproducible.
+    """
+    global _rng, _clock, _fixed_clock, _TODAY
+    random.seed(seed)
+    _rng = np.random.default_rng(seed)
+    _fixed_clock = fixed_clock
+    _clock = _FIXED_EPOCH if fixed_clock else _RUN_START
+    _TODAY = _clock.strftime('%Y%m%d')
+    _color_pool.clear()
+    _sentence_pools.clear()
+    _paragraph_pools.clear()
+
+
+def _seed_worker():
+    """Give a freshly started worker process its own RNG streams."""
+    seed_generators(os.getpid() ^ time.time_ns())
+
+
+def _dispatch(job):
+    """Run one (file_type, filepath, max_size_mb) job in a worker process."""
+    file_type, filepath, max_size_mb = job
+    FILE_GENERATORS[file_type](filepath, max_size_mb)
+    return filepath
+
+
+def generate_many(jobs, workers=None):
+    """
+    Generate many files in parallel from (file_type, filepath, max_size_mb) jobs.
     
-    return filepath, file_type
+    Every generator writes its own file, so jobs run in separate processes
+    without sharing state. The CPU-heavy types (png, jpg, pdf, xlsx) gain
+    the most from extra workers. Returns the file paths in job order.
+    """
+    with ProcessPoolExecutor(max_workers=workers, initializer=_seed_worker) as executor:
+        return list(executor.map(_dispatch, jobs))
+
+
+def _generate_task(output_dir, max_size_mb, seed, file_type, fixed_clock):
+    """Generate one random file from its own seed (runs in a worker process)."""
+    seed_generators(seed, fixed_clock)
+    return generate_random_file(output_dir, max_size_mb, file_type)
 
 
 def main():
@@ -1000,6 +1490,8 @@ def main():
     output_path = os.getenv('OUTPUT_PATH', './generated_files')
     num_files = int(os.getenv('NUM_FILES', '10'))
     max_size_mb = float(os.getenv('MAX_FILE_SIZE_MB', '1'))
+    num_workers = int(os.getenv('NUM_WORKERS') or os.cpu_count() or 1)
+    seed = os.getenv('SEED')
     
     # Validate max size
     if max_size_mb > 100:
@@ -1016,24 +1508,38 @@ def main():
     print(f"Number of files: {num_files}")
     print(f"Max file size: {max_size_mb} MB")
     print(f"Available file types: {len(FILE_GENERATORS)}")
+    print(f"Workers: {num_workers}")
     print(f"=" * 50)
     print()
     
-    # Generate files
+    # Give every file its own seed so results don't depend on which worker runs it
+    if seed:
+        random.seed(int(seed))
+    seeds = [random.getrandbits(64) for _ in range(num_files)]
+    file_types = random.choices(_FILE_TYPES, k=num_files)
+    
+    # Generate files in parallel; each file is independent
     generated = []
     type_counts = {}
     
-    for i in range(num_files):
-        try:
-            filepath, file_type = generate_random_file(str(output_dir), max_size_mb)
-            file_size = os.path.getsize(filepath)
-            generated.append((filepath, file_type, file_size))
-            type_counts[file_type] = type_counts.get(file_type, 0) + 1
-            
-            size_str = f"{file_size / 1024:.1f} KB" if file_size < 1024 * 1024 else f"{file_size / (1024 * 1024):.2f} MB"
-            print(f"[{i + 1}/{num_files}] Generated: {os.path.basename(filepath)} ({file_type}, {size_str})")
-        except Exception as e:
-            print(f"[{i + 1}/{num_files}] Error generating file: {e}")
+    output_dir_str = str(output_dir)
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = [
+            executor.submit(_generate_task, output_dir_str, max_size_mb, task_seed, file_type, bool(seed))
+            for task_seed, file_type in zip(seeds, file_types)
+        ]
+        
+        # Report files as they finish so one slow file doesn't hold back progress
+        for i, future in enumerate(as_completed(futures)):
+            try:
+                filepath, file_type, file_size = future.result()
+                generated.append((filepath, file_type, file_size))
+                type_counts[file_type] = type_counts.get(file_type, 0) + 1
+                
+                size_str = f"{file_size / 1024:.1f} KB" if file_size < 1024 * 1024 else f"{file_size / (1024 * 1024):.2f} MB"
+                print(f"[{i + 1}/{num_files}] Generated: {os.path.basename(filepath)} ({file_type}, {size_str})")
+            except Exception as e:
+                print(f"[{i + 1}/{num_files}] Error generating file: {e}")
     
     # End timing
     end_time = time.time()